@@ -1,15 +1,14 @@
 import warnings
+from importlib.util import find_spec
 
 
 def check_installed_packages(package_descriptions):
     installed_dict = {}
     for name, desc in package_descriptions.items():
-        try:
-            exec(f"import {name}")
-            installed_dict[name] = True
-        except ModuleNotFoundError:
+        # find_spec only locates the package, without executing (i.e. importing) it
+        installed_dict[name] = find_spec(name) is not None
+        if not installed_dict[name]:
             warnings.warn(f'Package "{name}" is not found. {desc}')
-            installed_dict[name] = False
     return installed_dict
 
 
@@ -4,20 +4,19 @@ and return a set of formal (or pattern) concepts.
 Some of them return a `ConceptLattice` instead of just a set of concepts.
 
 """
-from collections import deque
-from typing import List, Tuple, Iterator, Iterable, Union
+from typing import List, Tuple, Iterator, Union, Sequence
 from tqdm.auto import tqdm
+import numpy as np
 
-from bitarray import frozenbitarray as fbarray
-from bitarray.util import zeros as bazeros
-from caspailleur.order import inverse_order, sort_intents_inclusion
+from bitarray import bitarray, frozenbitarray as fbarray
+from bitarray.util import zeros as bazeros, subset as basubset, count_and as bacount_and
 
 from fcapy.context.formal_context import FormalContext
-from fcapy.context.bintable import BinTableBitarray
+from fcapy.context.bintable import init_bintable, BinTableBitarray
 from fcapy.mvcontext.mvcontext import MVContext
+from fcapy.mvcontext import pattern_structure as PS
 from fcapy.lattice.formal_concept import FormalConcept
 from fcapy.lattice.pattern_concept import PatternConcept
-from fcapy.utils import utils
 
 
 def close_by_one(context: Union[FormalContext, MVContext], n_projections_to_binarize: int = 1000)\
@@ -40,13 +39,7 @@ def close_by_one(context: Union[FormalContext, MVContext], n_projections_to_bina
 
     """
     if isinstance(context, FormalContext):
-        if context.n_objects < context.n_bin_attrs:
-            return close_by_one_objectwise_fbarray(context)
-        # not wide, i.e. contains more objects than attributes
-        return (
-            FormalConcept.from_objects(c.intent_i, context, is_extent=True)
-            for c in close_by_one_objectwise_fbarray(context.T)
-        )
+        return _formal_concepts_from_bitarrays(_close_by_one_concepts_ba(context), context)
 
     # not formal, i.e. many valued context
     try:
@@ -58,12 +51,83 @@ def close_by_one(context: Union[FormalContext, MVContext], n_projections_to_bina
         return close_by_one_objectwise(context)
 
     # n_projections <= n_projections_to_binarize:
-    if context.n_objects <= n_projections:
-        extents_iter = (c.extent_i for c in close_by_one_objectwise_fbarray(context.binarize()))
-    else:  # context.n_objects > n_projections
-        extents_iter = (c.intent_i for c in close_by_one_objectwise_fbarray(context.binarize().T))
+    # The extents of the binarized context are closed in the many valued context once again
+    return (PatternConcept.from_objects(extent_ba.search(True), context)
+            for extent_ba in close_by_one_extents(context))
 
-    return (PatternConcept.from_objects(extent, context) for extent in extents_iter)
+
+def close_by_one_extents(context: Union[FormalContext, MVContext]) -> Iterator[fbarray]:
+    """Return an iterator of the extents of all concepts generated by CloseByOne (CbO) algorithm
+
+    No concepts are constructed, so it is the cheapest way to run CbO when only the extents are needed.
+
+    Parameters
+    ----------
+    context: `FormalContext` or `MVContext`
+        A context to build the extents on. `MVContext` is binarized first
+
+    Returns
+    -------
+    extents: `iterator` of `frozenbitarray`
+        An iterator of extents where i-th bit of an extent is set iff the extent contains i-th object
+
+    """
+    context_bin = context.binarize() if isinstance(context, MVContext) else context
+    return (extent_ba for extent_ba, _ in _close_by_one_concepts_ba(context_bin))
+
+
+def _close_by_one_concepts_ba(context: FormalContext) -> Iterator[Tuple[fbarray, fbarray]]:
+    """Iterate (extent, intent) bitarrays of all concepts of a binary ``context`` running CbO over its narrower side
+
+    For a context with more objects than attributes CbO enumerates the combinations of attributes.
+    It runs over the columns of the context which are taken from its bitarray table,
+    so no transposed `FormalContext` is constructed.
+
+    """
+    bintable = init_bintable(context.data, 'BinTableBitarray')
+    n_objs, n_attrs = context.n_objects, context.n_bin_attrs
+
+    if n_objs < n_attrs:
+        yield from _close_by_one_fbarray_kernel(bintable, n_attrs)
+        return
+
+    # not wide, i.e. contains more objects than attributes
+    for intent_ba, extent_ba in _close_by_one_fbarray_kernel(bintable.T, n_objs):
+        yield extent_ba, intent_ba
+
+
+def _formal_concepts_from_bitarrays(extents_intents_ba: Iterator[Tuple[fbarray, fbarray]], context: FormalContext)\
+        -> Iterator[FormalConcept]:
+    """Assemble `FormalConcept`s of a ``context`` from the pairs of their extent and intent bitarrays
+
+    The intents come from CbO together with the extents, so they are not recomputed as in `FormalConcept.from_objects`.
+
+    """
+    extents_intents_i = ((list(extent_ba.search(True)), list(intent_ba.search(True)))
+                         for extent_ba, intent_ba in extents_intents_ba)
+    return _concepts_from_indices(extents_intents_i, context)
+
+
+def _concepts_from_indices(extents_intents_i: Iterator[Tuple[Sequence[int], Union[Sequence[int], dict]]],
+                           context: Union[FormalContext, MVContext]) -> Iterator[Union[FormalConcept, PatternConcept]]:
+    """Assemble the concepts of a ``context`` from the pairs of their extent and intent indices
+
+    The concepts are of class `FormalConcept` for a `FormalContext` and of class `PatternConcept` for an `MVContext`.
+    The names and the hash of the context are looked up only once for all the concepts.
+
+    """
+    object_names, attribute_names, context_hash = context.object_names, context.attribute_names, context.hash_fixed()
+    for extent_i, intent_i in extents_intents_i:
+        extent = [object_names[g_i] for g_i in extent_i]
+        if isinstance(context, FormalContext):
+            intent = [attribute_names[m_i] for m_i in intent_i]
+            yield FormalConcept(extent_i, extent, intent_i, intent, context_hash=context_hash)
+            continue
+
+        intent = {attribute_names[m_i]: v for m_i, v in intent_i.items()}
+        yield PatternConcept(extent_i, extent, intent_i, intent,
+                             pattern_types=context.pattern_types, attribute_names=attribute_names,
+                             context_hash=context_hash)
 
 
 def close_by_one_objectwise(context: Union[FormalContext, MVContext]) -> Iterator[Union[FormalConcept, PatternConcept]]:
@@ -81,35 +145,45 @@ def close_by_one_objectwise(context: Union[FormalContext, MVContext]) -> Iterato
         or `PatternConcept` (if given context is of type `MVContext`)
 
     """
-    n_objs = context.n_objects
-    concept_cls = FormalConcept if isinstance(context, FormalContext) else PatternConcept
+    yield from _concepts_from_indices(_close_by_one_objectwise_extents_intents_i(context), context)
 
+
+def _close_by_one_objectwise_extents_intents_i(context: Union[FormalContext, MVContext])\
+        -> Iterator[Tuple[Tuple[int, ...], Union[List[int], dict]]]:
+    """Yield the pairs of extent and intent indices of the concepts of ``context`` found by objectwise CbO"""
+    n_objs = context.n_objects
     extents_i_found = set()
-    combinations_to_check = deque([tuple()])
+    combinations_to_check = [tuple()]
 
     while combinations_to_check:
         comb_i = combinations_to_check.pop()
         intent_i = context.intention_i(comb_i)
-        comb_i_set = set(comb_i)
+        # A bitmask of the objects of the combination. The objects outside it are listed by bitarray.search in C,
+        # so no Python set is built and no membership is tested object by object
+        extent_mask = bazeros(n_objs)
+        extent_mask[list(comb_i)] = True
         if comb_i:
-            objects_lexicographic = [g_i for g_i in range(comb_i[-1]) if g_i not in comb_i_set]
+            objects_lexicographic = list(extent_mask.search(False, 0, comb_i[-1]))
             extent_lexicographic = context.extension_i(intent_i, base_objects_i=objects_lexicographic)
             if extent_lexicographic:
                 continue
 
-        base_objects_i = range(comb_i[-1]+1, n_objs) if comb_i else range(n_objs)
-        base_objects_i = [i for i in base_objects_i if i not in comb_i_set]
-        extent_i = comb_i + tuple(context.extension_i(intent_i, base_objects_i=base_objects_i))
+        base_objects_i = list(extent_mask.search(False, comb_i[-1]+1 if comb_i else 0))
+        new_objects_i = tuple(context.extension_i(intent_i, base_objects_i=base_objects_i))
+        extent_i = comb_i + new_objects_i
 
         if extent_i in extents_i_found:
             continue
 
-        yield concept_cls.from_objects(extent_i, context, is_extent=True)
+        # The intent of the closed extent equals the intent of a non-empty combination it is closed from.
+        # So it is passed on directly instead of being recomputed via `from_objects`.
+        # The intent of the empty combination is not always derived from the objects (e.g. for AttributePS),
+        # so the intent of the closure of the empty combination is recomputed
+        yield extent_i, intent_i if comb_i else context.intention_i(extent_i)
 
-        possible_new_objects = range(n_objs - 1, (comb_i[-1] if comb_i else 0) - 1, -1)
-        extent_i_set = set(extent_i)
-        new_combs = [extent_i + (g_i,) for g_i in possible_new_objects if g_i not in extent_i_set]
-        combinations_to_check.extend(new_combs)
+        extent_mask[list(new_objects_i)] = True
+        possible_new_objects = extent_mask.search(False, comb_i[-1] if comb_i else 0, n_objs, right=True)
+        combinations_to_check.extend([extent_i + (g_i,) for g_i in possible_new_objects])
 
 
 def close_by_one_objectwise_fbarray(context: Union[FormalContext, MVContext])\
@@ -128,55 +202,71 @@ def close_by_one_objectwise_fbarray(context: Union[FormalContext, MVContext])\
         or `PatternConcept` (if given context is of type `MVContext`)
 
     """
-    n_objs, n_attrs = context.n_objects, context.n_bin_attrs
     concept_cls = FormalConcept if isinstance(context, FormalContext) else PatternConcept
 
-    all_attrs = ~bazeros(n_attrs)
-
     context_bin = context.binarize() if isinstance(context, MVContext) else context
-    objs_descriptions = BinTableBitarray(context_bin.data.data).data
+    # init_bintable returns the table as is when it is already stored in bitarrays. So nothing is copied
+    bintable = init_bintable(context_bin.data, 'BinTableBitarray')
 
-    def intention_ba(objs_idxs: Iterable[int]) -> fbarray:
-        intent = all_attrs.copy()
-        for g_i in objs_idxs:
-            intent &= objs_descriptions[g_i]
-        return fbarray(intent)
+    extents_intents_ba = _close_by_one_fbarray_kernel(bintable, context.n_bin_attrs)
+    if concept_cls is FormalConcept:
+        yield from _formal_concepts_from_bitarrays(extents_intents_ba, context)
+        return
 
-    def extension_iter(intent_ba: fbarray, base_objects: Iterable[int] = range(n_objs)) -> Iterator[int]:
-        for g_i in base_objects:
-            if intent_ba & objs_descriptions[g_i] == intent_ba:
-                yield g_i
+    # The extents of the binarized context are closed in the many valued context once again
+    for extent_ba, _ in extents_intents_ba:
+        yield concept_cls.from_objects(extent_ba.search(True), context)
 
-    intents_found: set[fbarray] = set()
-    combinations_to_check = deque([tuple()])
-    n_cncpt = 0
+
+def _close_by_one_fbarray_kernel(bintable: BinTableBitarray, n_attrs: int) -> Iterator[Tuple[fbarray, fbarray]]:
+    """Enumerate (extent, intent) pairs of a binary context given by its table ``bintable`` with ``n_attrs`` columns
+
+    The kernel only works with bitarrays of objects and of attributes.
+    So it is free from any overhead of constructing concepts.
+
+    """
+    objs_descriptions = bintable.data
+    n_objs = len(objs_descriptions)
+    all_attrs = fbarray(~bazeros(n_attrs))
+    # The transposed table is cached by the table itself, so it is shared between the runs on the same context
+    attrs_extents = bintable.T.data if n_objs else [fbarray()] * n_attrs
+
+    # Intents are keyed by their raw bytes: frozenbitarray.__hash__ copies the bitarray on every call,
+    # while bytes objects cache their hash. All intents share the same length, so the keys are unambiguous
+    intents_found: set[bytes] = set()
+    # The worklist is a plain list used as a stack. Its entry (G \ A, A', g) describes a combination A ∪ {g}
+    # where G \ A is the bitarray of objects outside the extent A. It is the only representation of the extent A.
+    # All the children of a concept share its bitarrays, so pushing a child copies nothing.
+    # And the intent of a combination is computed by a single AND: (A ∪ {g})' = A' ∩ {g}'
+    combinations_to_check = [(fbarray(~bazeros(n_objs)), all_attrs, -1)]
+    # A scratch bitarray for the objects outside the parent extent described by the new intent.
+    # It is overwritten in place, so no bitarray is allocated for combinations that fail the canonicity test
+    closure_ba = bitarray(n_objs)
 
     while combinations_to_check:
-        comb_i = combinations_to_check.pop()
-        intent_ba = intention_ba(comb_i)
-        if intent_ba in intents_found:
+        parent_outside_ba, parent_intent_ba, g_new = combinations_to_check.pop()
+        intent_ba = parent_intent_ba & objs_descriptions[g_new] if g_new >= 0 else parent_intent_ba
+        intent_key = intent_ba.tobytes()
+        if intent_key in intents_found:
             continue
 
-        comb_i_set = set(comb_i)
-        if comb_i:
-            objects_lexicographic = (g_i for g_i in range(comb_i[-1]) if g_i not in comb_i_set)
-            objects_lexicographic = extension_iter(intent_ba, objects_lexicographic)
-            if any(True for _ in objects_lexicographic):
-                continue
+        closure_ba[:] = parent_outside_ba
+        for m_i in intent_ba.search(True):
+            closure_ba &= attrs_extents[m_i]
 
-        base_objects_i = range((comb_i[-1]+1) if comb_i else 0, n_objs)
-        base_objects_i = (i for i in base_objects_i if i not in comb_i_set)
-        extent_i = comb_i + tuple(extension_iter(intent_ba, base_objects_i))
-
-        yield concept_cls.from_objects(extent_i, context)
+        # Canonicity test: no object g_i < g_new outside the parent extent should be described by the new intent
+        if g_new > 0 and closure_ba.find(True, 0, g_new) >= 0:
+            continue
 
-        n_cncpt += 1
+        # closure_ba is a subset of parent_outside_ba, so XOR removes the new objects from the outside ones
+        outside_ba = parent_outside_ba ^ closure_ba
+        yield ~outside_ba, intent_ba
 
-        intents_found.add(intent_ba)
-        possible_new_objects = range(n_objs - 1, (comb_i[-1] if comb_i else 0) - 1, -1)
-        extent_i_set = set(extent_i)
-        new_combs = [extent_i + (g_i,) for g_i in possible_new_objects if g_i not in extent_i_set]
-        combinations_to_check.extend(new_combs)
+        intents_found.add(intent_key)
+        # The children are the objects outside the extent above g_new, pushed in descending order
+        combinations_to_check.extend([
+            (outside_ba, intent_ba, g_i) for g_i in outside_ba.search(True, g_new + 1, n_objs, right=True)
+        ])
 
 
 def sofia(
@@ -186,29 +276,35 @@ def sofia(
     min_supp = min_supp * len(K) if min_supp < 1 else min_supp
 
     if use_log_stability_bound:
-        def stability_lbounds(extents: List[fbarray]) -> List[float]:
+        def stability_lbounds(extents: List[fbarray], counts: List[int]) -> List[float]:
             #assert all(a.count() <= b.count() for a, b in zip(extents, extents[1:]))
             bounds = []
             for i, extent in enumerate(extents):
-                bound = extent.count()
-                for potent_child in extents[i-1::-1]:
-                    if potent_child & extent == potent_child:
-                        bound -= potent_child.count()
+                bound = counts[i]
+                # Same order as extents[i-1::-1]: the first extent is scanned against all the extents, itself included
+                for child_i in range(i-1 if i else len(extents)-1, -1, -1):
+                    if basubset(extents[child_i], extent):
+                        bound -= counts[child_i]
                         break
                 bounds.append(bound)
             return bounds
     else:
-        def stability_lbounds(extents: List[fbarray]) -> List[float]:
+        from caspailleur.order import inverse_order, sort_intents_inclusion
+
+        def stability_lbounds(extents: List[fbarray], counts: List[int]) -> List[float]:
             children_ordering = inverse_order(sort_intents_inclusion(extents))
+            # Every child is a subset of its parent, so |parent \ child| = |parent| - |child|
             children_intersections = (
-                ((extent & (~extents[child])).count() for child in children.search(True))
-                if children.any() else [extent.count()]
-                for children, extent in zip(children_ordering, extents)
+                (counts[i] - counts[child] for child in children.search(True))
+                if children.any() else [counts[i]]
+                for i, children in enumerate(children_ordering)
             )
             bounds = [1-sum(2**(-v) for v in intersections) for intersections in children_intersections]
             return bounds
 
     extents_proj: List[fbarray] = [fbarray(~bazeros(K.n_objects))]
+    # The supports of extents_proj. They are carried over between projections, so every extent is counted only once
+    counts_proj: List[int] = [K.n_objects]
 
     n_projs = K.n_bin_attrs
     proj_iterator = tqdm(enumerate(K.to_bin_attr_extents()),
@@ -220,15 +316,25 @@ def sofia(
         if attr_extent_ba.count() < min_supp:
             continue
 
-        new_extents = {extent & attr_extent_ba for extent in extents_proj}
-        extents_proj = sorted(set(extents_proj) | new_extents, key=lambda extent: extent.count())
-        extents_proj = extents_proj[:1] + [extent for extent in extents_proj[1:] if extent.count() >= min_supp]
+        # Merge the old and the new extents in one pass: deduplicate them by raw bytes and count the new ones on insertion
+        extents_counts = {extent.tobytes(): (extent, count) for extent, count in zip(extents_proj, counts_proj)}
+        for extent in extents_proj:
+            new_extent = extent & attr_extent_ba
+            new_key = new_extent.tobytes()
+            if new_key not in extents_counts:
+                extents_counts[new_key] = (new_extent, new_extent.count())
+        extents_counts = sorted(extents_counts.values(), key=lambda extent_count: extent_count[1])
+        extents_counts = extents_counts[:1] + [extent_count for extent_count in extents_counts[1:]
+                                               if extent_count[1] >= min_supp]
+        extents_proj, counts_proj = [extent for extent, _ in extents_counts], [count for _, count in extents_counts]
 
         if len(extents_proj) > L_max:
-            measure_values = stability_lbounds(extents_proj)
-            thold = sorted(measure_values)[::-1][L_max]
-            extents_proj = [extent for extent_i, (extent, measure) in enumerate(zip(extents_proj, measure_values))
-                            if measure > thold or extent_i in {0, len(extents_proj)-1}]
+            measure_values = np.array(stability_lbounds(extents_proj, counts_proj))
+            thold = np.partition(measure_values, -L_max-1)[-L_max-1]  # (L_max+1)-th biggest value found in O(n)
+            is_kept = measure_values > thold
+            is_kept[[0, -1]] = True
+            extents_proj = [extent for extent, flg_kept in zip(extents_proj, is_kept) if flg_kept]
+            counts_proj = [count for count, flg_kept in zip(counts_proj, is_kept) if flg_kept]
 
     concept_cls = FormalConcept if isinstance(K, FormalContext) else PatternConcept
     final_concepts = [concept_cls.from_objects(extent.search(True), K, is_extent=True) for extent in extents_proj]
@@ -245,7 +351,8 @@ def parse_decision_tree_to_extents(tree, X, n_jobs=1) -> List[Tuple[int, ...]]:
     X: `numpy.ndarray`
         An input data for ``tree`` model. The same format it is used for ``tree.predict(X)`` function
     n_jobs: `int`
-        A number of parallel jobs to run. WARNING: A number of jobs works slower than a single one.
+        Not used. The extents are read out of the decision paths in a single pass, so there is nothing to parallelize.
+        The parameter is kept for backward compatibility.
     Returns
     -------
     exts: `list` of `int`
@@ -259,17 +366,15 @@ def parse_decision_tree_to_extents(tree, X, n_jobs=1) -> List[Tuple[int, ...]]:
     else:
         paths = tree.decision_path(X).tocsc()
 
-    def get_indices(i, paths):
-        return paths.indices[paths.indptr[i]:paths.indptr[i + 1]]
-    paths = utils.sparse_unique_columns(paths)[0]
-
-    if n_jobs == 1:
-        exts = [get_indices(i, paths) for i in range(paths.shape[1])]
-    else:
-        from joblib import Parallel, delayed
-        exts = Parallel(n_jobs)([delayed(get_indices)(i, paths) for i in range(paths.shape[1])])
-    exts = [tuple(ext) for ext in exts]
-    return exts
+    if not paths.has_sorted_indices:
+        paths.sort_indices()
+    # Convert all the indices to Python ints at once and slice the columns out of a plain list.
+    # It is much cheaper than slicing numpy arrays column by column (or via np.split)
+    indices, indptr = paths.indices.tolist(), paths.indptr.tolist()
+    # The columns of decision paths are boolean. So two columns are equal iff they have the same row indices,
+    # and the unique columns are found by hashing the tuples of indices (in the order of their first appearance)
+    unique_extents = dict.fromkeys(tuple(indices[start:stop]) for start, stop in zip(indptr[:-1], indptr[1:]))
+    return list(unique_extents)
 
 
 def random_forest_concepts(context: Union[FormalContext, MVContext], rf_params=None, rf_class=None):
@@ -297,7 +402,9 @@ def random_forest_concepts(context: Union[FormalContext, MVContext], rf_params=N
 
     rf_params = rf_params if rf_params is not None else {}
 
-    X = context.to_numeric()[0]
+    # sklearn trees work with float32 features. Converting the data once here saves one conversion in `fit`
+    # and one in `decision_path`
+    X = np.asarray(context.to_numeric()[0], dtype=np.float32)
     Y = context.target
 
     if rf_class is None:
@@ -308,7 +415,44 @@ def random_forest_concepts(context: Union[FormalContext, MVContext], rf_params=N
     extents_i = parse_decision_tree_to_extents(rf, X)
     extents_i.append(context.extension_i(context.intention_i([])))
 
-    return [concept_cls.from_objects(extent_i, context, is_extent=True) for extent_i in extents_i]
+    if concept_cls is FormalConcept:
+        return [concept_cls.from_objects(extent_i, context, is_extent=True) for extent_i in extents_i]
+
+    return list(_concepts_from_indices(zip(extents_i, _intents_i_of_extents(context, extents_i)), context))
+
+
+def _intents_i_of_extents(context: MVContext, extents_i: List[Tuple[int, ...]]) -> List[dict]:
+    """Return the intents of all ``extents_i`` of ``context`` computed in one pass per pattern structure
+
+    The interval pattern structures are reduced by numpy for all non-empty extents at once:
+    the objects of all the extents are concatenated and every extent is reduced as a segment of the concatenation.
+    The other pattern structures compute the intent of each extent one by one.
+    So do the interval pattern structures with NaN values in their data, as numpy reduction would propagate NaNs
+    while `IntervalPS.intention_i` skips them
+    """
+    intents_i = [{} for _ in extents_i]
+    nonempty_ids = [i for i, extent_i in enumerate(extents_i) if len(extent_i)]
+    nonempty_extents = [extents_i[i] for i in nonempty_ids]
+    objects_concat = np.fromiter((g_i for extent_i in nonempty_extents for g_i in extent_i), dtype=int)
+    segments_starts = np.cumsum([0] + [len(extent_i) for extent_i in nonempty_extents[:-1]])
+
+    for ps_i, ps in enumerate(context.pattern_structures):
+        data = np.asarray(ps.data, dtype=float) if isinstance(ps, PS.IntervalPS) and nonempty_extents else None
+        if data is None or np.isnan(data).any():
+            for intent_i, extent_i in zip(intents_i, extents_i):
+                intent_i[ps_i] = ps.intention_i(extent_i)
+            continue
+
+        for i, extent_i in enumerate(extents_i):
+            if not len(extent_i):
+                intents_i[i][ps_i] = ps.intention_i(extent_i)
+
+        data = data[objects_concat]
+        mins = np.minimum.reduceat(data[:, 0], segments_starts).tolist()
+        maxs = np.maximum.reduceat(data[:, 1], segments_starts).tolist()
+        for i, min_, max_ in zip(nonempty_ids, mins, maxs):
+            intents_i[i][ps_i] = (min_, max_)
+    return intents_i
 
 
 def lindig_algorithm(context: FormalContext, iterate_extents=None):
@@ -339,32 +483,44 @@ def lindig_algorithm(context: FormalContext, iterate_extents=None):
 
     n_objects = context.n_objects
     n_attributes = context.n_attributes
-    intention_i = context.intention_i
     extension_i = context.extension_i
     object_names = context.object_names
     attribute_names = context.attribute_names
+    bintable = init_bintable(context.data, 'BinTableBitarray')
+    objs_descriptions = bintable.data
+    attrs_extents = bintable.T.data if n_objects else [fbarray()] * n_attributes
     if not iterate_extents:
         n_objects, n_attributes = n_attributes, n_objects
-        intention_i, extension_i = extension_i, intention_i
+        extension_i = context.intention_i
         object_names, attribute_names = attribute_names, object_names
+        objs_descriptions, attrs_extents = attrs_extents, objs_descriptions
     context_hash = context.hash_fixed()
+    all_objects = fbarray(~bazeros(n_objects))
 
+    def extension_ba(intent_ba: bitarray) -> bitarray:
+        extent_ba = bitarray(all_objects)
+        for m_i in intent_ba.search(True):
+            extent_ba &= attrs_extents[m_i]
+        return extent_ba
 
     def direct_super_concepts(concept):
-        extent = set(concept.extent_i)
-        reps = set(range(n_objects)) - extent
+        extent_ba, intent_ba = bazeros(n_objects), bazeros(n_attributes)
+        extent_ba[list(concept.extent_i)] = True
+        intent_ba[list(concept.intent_i)] = True
+
+        reps = ~extent_ba
         neighbors = []
-        for g in set(reps):
-            extent.add(g)
-            M = intention_i(list(extent))
-            G = extension_i(M)
-            extent.remove(g)
-            if len(reps & set(G)) == 1:
+        for g in list(reps.search(True)):
+            # The intent of extent + {g} is the intent of the concept restricted to the description of g
+            M_ba = intent_ba & objs_descriptions[g]
+            G_ba = extension_ba(M_ba)
+            if bacount_and(reps, G_ba) == 1:
+                G, M = list(G_ba.search(True)), list(M_ba.search(True))
                 neighbors.append(FormalConcept(G, [object_names[i] for i in G],
                                                M, [attribute_names[i] for i in M],
                                                context_hash = context_hash))
             else:
-                reps.remove(g)
+                reps[g] = False
         return neighbors
 
     M = list(range(n_attributes))
@@ -414,7 +570,7 @@ def lcm_skmine(context: Union[FormalContext, MVContext], min_supp: float = 1, n_
     from skmine.itemsets import LCM
 
     context_bin = context if isinstance(context, FormalContext) else context.binarize()
-    itemsets = [list(row.search(True)) for row in BinTableBitarray(context_bin.data.data)]
+    itemsets = [list(row.search(True)) for row in init_bintable(context_bin.data, 'BinTableBitarray').data]
 
     lcm = LCM(min_supp=min_supp, n_jobs=n_jobs)
     lcm_data = lcm.fit_transform(itemsets, return_tids=True)
@@ -430,4 +586,6 @@ def lcm_skmine(context: Union[FormalContext, MVContext], min_supp: float = 1, n_
         extents_i.append(list(range(context_bin.n_objects)))
 
     concept_cls = FormalConcept if isinstance(context, FormalContext) else PatternConcept
-    return [concept_cls.from_objects(extent_i, context) for extent_i in extents_i]
+    # The tid-lists of the binarized context are not always closed in the many valued context
+    is_extent = concept_cls is FormalConcept
+    return [concept_cls.from_objects(extent_i, context, is_extent=is_extent) for extent_i in extents_i]
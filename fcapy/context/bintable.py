@@ -541,6 +541,33 @@ class BinTableBitarray(AbstractBinTable):
     data: List[fbarray]  # Updating type hint
     Row_DType = fbarray
 
+    @AbstractBinTable.data.setter
+    def data(self, value):
+        AbstractBinTable.data.fset(self, value)
+        # The partner table refers back to this one, so its link should be dropped as well
+        transposed = getattr(self, '_transposed', None)
+        if transposed is not None:
+            transposed._transposed = None
+        self._transposed = None
+
+    @property
+    def T(self) -> 'BinTableBitarray':
+        # The transposed table is computed once. Its own transpose is this very table, so T.T costs nothing
+        if getattr(self, '_transposed', None) is not None:
+            return self._transposed
+
+        if self.height == 0 or self.width == 0:
+            return self.__class__([])
+
+        # Transpose the whole table at once via NumPy instead of collecting every column bit by bit
+        rows = [row if row.endian() == 'big' else fbarray(row, 'big') for row in self.data]
+        rows_bytes = np.frombuffer(b''.join(row.tobytes() for row in rows), dtype=np.uint8).reshape(self.height, -1)
+        bits = np.unpackbits(rows_bytes, axis=1)[:, :self.width]
+        columns_bytes = np.packbits(bits.T, axis=1)
+        transposed = self.__class__([fbarray(buffer=col_bytes.tobytes())[:self.height] for col_bytes in columns_bytes])
+        self._transposed, transposed._transposed = transposed, self
+        return transposed
+
     def all_i(self, axis: int, rows: List[int] = None, columns: List[int] = None) -> List[int]:
         flg_all = self.all(axis, rows, columns)
 
@@ -576,6 +603,12 @@ class BinTableBitarray(AbstractBinTable):
 
         return True
 
+    def _columns_mask(self, columns: List[int]) -> fbarray:
+        """Return a bitarray of the table width where only the bits of ``columns`` are set"""
+        mask = butil.zeros(self.width)
+        mask[list(columns)] = True
+        return fbarray(mask)
+
     def _all(self, rows: List[int] = None, columns: List[int] = None) -> bool:
         rows = range(self.height) if rows is None else rows
         if columns is None:
@@ -584,12 +617,10 @@ class BinTableBitarray(AbstractBinTable):
                 if not row.all():
                     return False
         else:
-            columns = set(columns)
-            mask = fbarray([j not in columns for j in range(self.width)])
+            mask = self._columns_mask(columns)
 
             for i in rows:
-                row = self.data[i]
-                if not (row | mask).all():
+                if not butil.subset(mask, self.data[i]):
                     return False
 
         return True
@@ -599,10 +630,9 @@ class BinTableBitarray(AbstractBinTable):
         if columns is None:
             return fbarray([self.data[i].all() for i in rows])
 
-        columns = set(columns)
-        mask = fbarray([j not in columns for j in range(self.width)])
-
-        return fbarray([(self.data[i] | mask).all() for i in rows])
+        # A row has all the columns iff the mask of the columns is its subset. The test allocates no bitarray
+        mask = self._columns_mask(columns)
+        return fbarray([butil.subset(mask, self.data[i]) for i in rows])
 
     def _all_per_column(self, rows: List[int] = None, columns: List[int] = None) -> Row_DType:
         rows = range(self.height) if rows is None else rows
@@ -613,14 +643,13 @@ class BinTableBitarray(AbstractBinTable):
                 if not vals.any():  # If all values are False
                     break
         else:
-            columns_set = set(columns)
-            mask = fbarray([j in columns_set for j in range(self.width)])
+            mask = self._columns_mask(columns)
             for i in rows:
                 vals &= self.data[i]
-                if not (vals & mask).any():  # If all values are False
+                if not butil.any_and(vals, mask):  # If all values are False
                     break
 
-            vals = fbarray([vals[i] for i in columns])
+            vals = fbarray(vals[list(columns)])
         return vals
 
     def _any(self, rows: List[int] = None, columns: List[int] = None) -> bool:
@@ -630,11 +659,10 @@ class BinTableBitarray(AbstractBinTable):
                 if self.data[i].any():
                     return True
         else:
-            columns = set(columns)
-            mask = fbarray([j in columns for j in range(self.width)])
+            mask = self._columns_mask(columns)
 
             for i in rows:
-                if (self.data[i] & mask).any():
+                if butil.any_and(self.data[i], mask):
                     return True
 
         return False
@@ -644,9 +672,9 @@ class BinTableBitarray(AbstractBinTable):
         if columns is None:
             return fbarray([self.data[i].any() for i in rows])
 
-        columns = set(columns)
-        mask = fbarray([j in columns for j in range(self.width)])
-        return fbarray([(self.data[i] & mask).any() for i in rows])
+        # The tests AND the rows with the mask of the columns without allocating any bitarray
+        mask = self._columns_mask(columns)
+        return fbarray([butil.any_and(self.data[i], mask) for i in rows])
 
     def _any_per_column(self, rows: List[int] = None, columns: List[int] = None) -> Row_DType:
         rows = range(self.height) if rows is None else rows
@@ -658,15 +686,14 @@ class BinTableBitarray(AbstractBinTable):
                 if vals.all():
                     break
         else:
-            columns_set = set(columns)
-            mask = fbarray([j not in columns_set for j in range(self.width)])
+            mask = self._columns_mask(columns)
 
             for i in rows:
                 vals |= self.data[i]
-                if (vals | mask).all():
+                if butil.subset(mask, vals):  # If all values are True
                     break
 
-            vals = fbarray([vals[i] for i in columns])
+            vals = fbarray(vals[list(columns)])
         return vals
 
     def _sum(self, rows: List[int] = None, columns: List[int] = None) -> int:
@@ -677,9 +704,8 @@ class BinTableBitarray(AbstractBinTable):
         if columns is None:
             return [self.data[i].count() for i in rows]
 
-        columns = set(columns)
-        mask = fbarray([j in columns for j in range(self.width)])
-        return [(self.data[i] & mask).count() for i in rows]
+        mask = self._columns_mask(columns)
+        return [butil.count_and(self.data[i], mask) for i in rows]
 
     def _sum_per_column(self, rows: List[int] = None, columns: List[int] = None) -> List[int]:
         rows = range(self.height) if rows is None else rows
@@ -691,8 +717,7 @@ class BinTableBitarray(AbstractBinTable):
         else:
             vals = [0] * len(columns)
 
-            columns_set = set(columns)
-            mask = fbarray([j in columns_set for j in range(self.width)])
+            mask = self._columns_mask(columns)
             for i in rows:
                 for j in (self.data[i] & mask).search(1):
                     vals[j] += 1
@@ -734,7 +759,10 @@ class BinTableBitarray(AbstractBinTable):
         return self.data == other.data
 
     def __hash__(self):
-        return hash(tuple(self.data))
+        # frozenbitarray.__hash__ copies every row before hashing it. Hash the raw bytes of all the rows at once instead.
+        # The rows are converted to big endian (if needed) to keep the hash independent of endianness, as fbarray does
+        rows = (row if row.endian() == 'big' else fbarray(row, 'big') for row in self.data)
+        return hash((self.height, self.width, b''.join([row.tobytes() for row in rows])))
 
     def __and__(self, other: 'BinTableBitarray') -> 'BinTableBitarray':
         assert self.shape == other.shape
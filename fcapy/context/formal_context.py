@@ -115,6 +115,7 @@ class FormalContext:
     @object_names.setter
     def object_names(self, value):
         """Set the names of objects in the context"""
+        self._hash_fixed = None
         if self.data is None:
             self._object_names = None
             self._object_names_i_map = None
@@ -153,6 +154,7 @@ class FormalContext:
     @attribute_names.setter
     def attribute_names(self, value):
         """Set the names of the attributes in the context"""
+        self._hash_fixed = None
         if self.data is None:
             self._attribute_names = None
             self._attribute_names_i_map = None
@@ -668,13 +670,20 @@ class FormalContext:
         return len(self.object_names)
 
     def hash_fixed(self):
-        """Hash value of FormalContext which do not differ between sessions"""
-        str_ = str(self._object_names)
-        str_ += str(self._attribute_names)
-        str_ += str(self._data.to_list())
+        """Hash value of FormalContext which do not differ between sessions
 
-        code = zlib.adler32(str_.encode())
-        return code
+        The value is computed once and memoized, since every concept constructed from the context asks for it.
+        Setting new object or attribute names, or new data of the binary table, resets the memoized value
+        """
+        # The memo is read via getattr as the contexts pickled before it was introduced do not have it
+        data = self._data.data
+        memo = getattr(self, '_hash_fixed', None)
+        if memo is None or memo[0] is not data:
+            str_ = str(self._object_names)
+            str_ += str(self._attribute_names)
+            str_ += str(self._data.to_list())
+            memo = self._hash_fixed = (data, zlib.adler32(str_.encode()))
+        return memo[1]
 
     def __getitem__(self, item):
         if type(item) != tuple:
@@ -714,9 +723,9 @@ class FormalContext:
         return self._data.to_list(), self._attribute_names
 
     def to_bin_attr_extents(self) -> Iterator[Tuple[str, fbarray]]:
-        for i, m in enumerate(self.attribute_names):
-            extent = fbarray(self.data[:, i])
-            yield m, extent
+        # Transposing the table once is much faster than slicing its columns one by one
+        for m, extent in zip(self.attribute_names, self.data.T.data):
+            yield m, fbarray(extent)
 
     @property
     def n_bin_attrs(self) -> int:
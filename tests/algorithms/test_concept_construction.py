@@ -53,6 +53,50 @@ def test_close_by_one():
     assert set(concepts) == {c0, c1, c2, c3}, 'Close_by_one failed.'
 
 
+def test_close_by_one_objectwise_attribute_ps():
+    pattern_types = {'a': PS.AttributePS, 'b': PS.AttributePS}
+    for data in [[[True, False], [True, True]], [[False, True]]]:
+        mvctx = mvcontext.MVContext(data, pattern_types, attribute_names=['a', 'b'])
+        for c in cca.close_by_one_objectwise(mvctx):
+            assert c.intent_i == mvctx.intention_i(c.extent_i),\
+                'close_by_one_objectwise failed. The intent is not the one of the extent'
+            assert sorted(c.extent_i) == sorted(mvctx.extension_i(c.intent_i)),\
+                'close_by_one_objectwise failed. The extent is not closed'
+
+    mvctx = mvcontext.MVContext([[True, False], [True, True]], pattern_types, attribute_names=['a', 'b'])
+    top_concept = next(c for c in cca.close_by_one_objectwise(mvctx) if len(c.extent_i) == 2)
+    assert top_concept.intent_i == {0: True, 1: False}, 'close_by_one_objectwise failed. Wrong intent of the top concept'
+
+
+def test_binarized_concepts_attribute_ps():
+    pattern_types = {'a': PS.AttributePS, 'b': PS.AttributePS}
+    mvctx = mvcontext.MVContext([[True, False], [False, True]], pattern_types, attribute_names=['a', 'b'])
+    for algo in [cca.close_by_one, cca.close_by_one_objectwise_fbarray, cca.lcm_skmine]:
+        for c in algo(mvctx):
+            assert sorted(c.extent_i) == sorted(mvctx.extension_i(c.intent_i)),\
+                f'{algo.__name__} failed. The extent of the binarized context is not closed in MVContext'
+
+
+def test_close_by_one_extents():
+    with open('data/animal_movement_concepts.json', 'r') as f:
+        file_data = json.load(f)
+    context = read_json("data/animal_movement.json")
+    extents = [tuple(extent.search(True)) for extent in cca.close_by_one_extents(context)]
+    extents_true = {tuple(sorted(c_json['Ext']['Inds'])) for c_json in file_data}
+    assert len(extents) == len(extents_true) and set(extents) == extents_true,\
+        'close_by_one_extents failed. The extents do not match the true ones'
+
+    context = read_csv("data/mango_bin.csv")
+    extents = [tuple(extent.search(True)) for extent in cca.close_by_one_extents(context)]
+    extents_true = {tuple(sorted(c.extent_i)) for c in cca.close_by_one_objectwise(context)}
+    assert len(extents) == len(extents_true) and set(extents) == extents_true,\
+        'close_by_one_extents failed. The extents do not match the ones of close_by_one_objectwise'
+
+    mvctx = mvcontext.MVContext([[1], [2]], {'M1': PS.IntervalPS}, ['a', 'b'], ['M1'])
+    extents = {tuple(extent.search(True)) for extent in cca.close_by_one_extents(mvctx)}
+    assert extents == {(0, 1), (0,), (1,), ()}, 'close_by_one_extents failed. Wrong extents of MVContext'
+
+
 def test_sofia():
     ctx = read_cxt('data/digits.cxt')
     concepts_all = list(cca.close_by_one(ctx))
@@ -78,6 +122,10 @@ def test_sofia():
     assert mean_stability_half > mean_stability_all, \
         'sofia failed. Sofia algorithm does not produce the subset of stable concepts'
 
+    extents = {tuple(sorted(c.extent_i)) for c in cca.sofia(ctx, L_max=3, use_log_stability_bound=True)}
+    assert extents == {tuple(range(10)), (0, 1, 3, 4, 5, 6, 7, 8, 9), (0, 3, 7, 8, 9), (8,)},\
+        'sofia failed. Wrong extents selected by the logarithmic stability bound'
+
 
 def test_parse_decision_tree_to_extents():
     iris_data = load_iris()
@@ -124,6 +172,23 @@ def test_random_forest_concepts():
     assert acc_train == 1, 'random_forest_concepts failed'
     assert acc_test >= 0.88, 'random_forest_concepts failed'
 
+
+def test_intents_i_of_extents():
+    data = [[1, (2, 3), {'a'}, True], [0.5, (1, 4), {'a', 'b'}, True], [4, (0, 1), {'b'}, False]]
+    pattern_types = {'M1': PS.IntervalPS, 'M2': PS.IntervalNumpyPS, 'M3': PS.SetPS, 'M4': PS.AttributePS}
+    extents_i = [(0, 1, 2), (1,), (), (0, 2), (2, 1), ()]
+    mvctx = mvcontext.MVContext(data, pattern_types, attribute_names=['M1', 'M2', 'M3', 'M4'])
+    intents_i = cca._intents_i_of_extents(mvctx, extents_i)
+    assert intents_i == [mvctx.intention_i(extent_i) for extent_i in extents_i],\
+        '_intents_i_of_extents failed. The intents do not match the ones of MVContext.intention_i'
+
+    data_nan = [[np.nan, np.nan], [1, 1], [2, 2]]
+    mvctx = mvcontext.MVContext(data_nan, {'M1': PS.IntervalPS, 'M2': PS.IntervalNumpyPS}, attribute_names=['M1', 'M2'])
+    extents_i = extents_i + [(1, 0), (2, 0, 1)]
+    intents_i = cca._intents_i_of_extents(mvctx, extents_i)
+    assert repr(intents_i) == repr([mvctx.intention_i(extent_i) for extent_i in extents_i]),\
+        '_intents_i_of_extents failed. The intents of data with NaNs do not match the ones of MVContext.intention_i'
+
     
 def test_lindig_algorithm():
     context = FormalContext.read_csv('data/mango_bin.csv')
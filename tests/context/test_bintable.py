@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from bitarray import frozenbitarray as fbarray
 from fcapy.context import bintable as btables
 from fcapy.context import bintable_errors as berrors
 from .data_to_test import animal_movement_data
@@ -60,6 +61,11 @@ def test_hash():
         set_small = {bt1, bt2}
         assert set_big == set_small, 'BinTable.__hash__ failed'
 
+    bt_big = btables.BinTableBitarray([fbarray(row, 'big') for row in data])
+    bt_little = btables.BinTableBitarray([fbarray(row, 'little') for row in data])
+    assert bt_big == bt_little and hash(bt_big) == hash(bt_little),\
+        'BinTableBitarray.__hash__ failed. The hash should not depend on endianness of bitarrays'
+
 
 def test_all():
     data = [[False, False], [False, True], [True, True]]
@@ -206,6 +212,24 @@ def test_transpose():
     for class_name, BTClass in btables.BINTABLE_CLASSES.items():
         bt = BTClass(data)
         assert bt.T.T == bt, f"{class_name}.T failed"
+        assert bt.T.to_list() == [list(col) for col in zip(*data)], f"{class_name}.T failed"
+
+    data_wide = [[(i * j) % 3 == 0 for j in range(19)] for i in range(11)]
+    for class_name, BTClass in btables.BINTABLE_CLASSES.items():
+        bt = BTClass(data_wide)
+        assert bt.T.to_list() == [list(col) for col in zip(*data_wide)], f"{class_name}.T failed"
+
+    bt = btables.BinTableBitarray(data)
+    assert bt.T is bt.T and bt.T.T is bt, "BinTableBitarray.T failed. The transposed table is not cached"
+    bt.data = data_wide
+    assert bt.T.to_list() == [list(col) for col in zip(*data_wide)],\
+        "BinTableBitarray.T failed. The cached transposed table is not updated with the data"
+
+    bt = btables.BinTableBitarray(data)
+    bt_t = bt.T
+    bt_t.data = [[True, True, True], [True, True, True], [False, False, False]]
+    assert bt.T.to_list() == [list(col) for col in zip(*data)] and bt.T.T is bt,\
+        "BinTableBitarray.T failed. The cached transposed table is not updated with the data of the transposed table"
 
 
 def test_init_bintable():
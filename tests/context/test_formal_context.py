@@ -263,6 +263,25 @@ def test_transpose():
     assert K.T.T == K
 
 
+def test_hash_fixed():
+    data = [[False, True, True], [False, False, True], [False, False, True]]
+    K = FormalContext(data)
+    hash_fixed = K.hash_fixed()
+    assert K.hash_fixed() == hash_fixed == FormalContext(data).hash_fixed()
+
+    K.object_names = ['a', 'b', 'c']
+    assert K.hash_fixed() != hash_fixed, 'FormalContext.hash_fixed failed. The value is not updated with object names'
+    assert K.hash_fixed() == FormalContext(data, object_names=['a', 'b', 'c']).hash_fixed()
+
+    hash_fixed = K.hash_fixed()
+    K.data.data = [[True, True, True], [False, False, True], [False, False, True]]
+    assert K.hash_fixed() != hash_fixed, 'FormalContext.hash_fixed failed. The value is not updated with the data'
+
+    del K._hash_fixed  # as in the contexts pickled before hash_fixed was memoized
+    assert K.hash_fixed() == FormalContext(K.data.to_list(), object_names=['a', 'b', 'c']).hash_fixed(),\
+        'FormalContext.hash_fixed failed. The value of a context without the memo is not computed'
+
+
 def test_getitem():
     data = [[False, True, True], [False, False, True], [False, False, True]]
     ctx = FormalContext(data)